@@ -1,11 +1,91 @@
 import os
+import json
+import hashlib
+import math
+import multiprocessing
 import argparse
-import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
+import pyarrow.parquet as pq
 import re
+import tempfile
 import threading
+import cv2
+import numpy as np
+import pytesseract
+from PIL import Image
+from langdetect import DetectorFactory, detect_langs
+from langdetect.lang_detect_exception import LangDetectException
 from datetime import datetime
-from langchain_community.document_loaders import UnstructuredFileLoader
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import pymupdf
+except ImportError:
+    pymupdf = None
+
+try:
+    import re2
+except ImportError:
+    re2 = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+SECTOR_CODE_MAX_GAP = 200
+SECTOR_CODE_LITERAL = np.frombuffer(b"paritaire", dtype=np.uint8)
+DIGIT_TABLE = np.array([48 <= c <= 57 for c in range(256)])
+CODE_CHAR_TABLE = np.array(
+    [48 <= c <= 57 or c == 46 or chr(c).isspace() for c in range(256)]
+)
+SCANNER_MIN_CHARS = 1_000_000
+
+regex_engine = re2 if re2 is not None else re
+SECTOR_CODE_PATTERN = regex_engine.compile(
+    rf"(?i)(paritaires?[^\d]{{0,{SECTOR_CODE_MAX_GAP}}}[\d\s.]+)"
+)
+CODE_SEPARATOR_PATTERN = regex_engine.compile(r"(?:[^\d.]+|\.{2,})+")
+VALID_CODE_PATTERN = regex_engine.compile(r"\d{3,}(?:\.\d*)?")
+
+RESULT_SCHEMA = pa.schema(
+    [
+        ("Document Name", pa.string()),
+        ("Sector Codes", pa.string()),
+        ("Number of Codes", pa.int64()),
+        ("Processing Time", pa.string()),
+        ("Used OCR Only", pa.bool_()),
+        ("Content Hash", pa.string()),
+        ("Pipeline", pa.string()),
+    ]
+)
+CACHED_COLUMNS = ["Sector Codes", "Number of Codes", "Used OCR Only", "Pipeline"]
+HASH_CHUNK_SIZE = 1 << 20
+OCR_LANGUAGES = "fra+nld"
+LANGUAGE_CODES = {"fr": "fra", "nl": "nld", "en": "eng"}
+LANGUAGE_DETECTION_CHARS = 4000
+LANGUAGE_DETECTION_MIN_PROBABILITY = 0.9
+LANGUAGE_CACHE_SIZE = 32
+OCR_DPI = 200
+OCR_CONFIG = "--oem 1 --psm 6"
+OCR_BATCH_SIZE = 50
+PAGE_POOL_MIN_PAGES = 8
+SHORT_DOCUMENT_MAX_PAGES = 3
+SHORT_DOCUMENT_MIN_CHARS = 200
+
+LOG_LOCK = threading.Lock()
+log_files = {}
+page_worker_document = None
+page_worker_languages = OCR_LANGUAGES
+document_languages = {}
+
+DetectorFactory.seed = 0
+
+
+class ExtractionError(Exception):
+    pass
 
 
 def ensure_dir(file_path):
@@ -14,27 +94,230 @@ def ensure_dir(file_path):
         os.makedirs(directory)
 
 
+def init_worker():
+    os.environ["OMP_THREAD_LIMIT"] = "1"
+    os.environ["OMP_NUM_THREADS"] = "1"
+
+
 def log_msg(message, log_file, print_console=True):
     current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     formatted_message = f"{current_time} - {message}"
     if print_console:
         print(formatted_message)
     if log_file:
-        with threading.Lock():
-            with open(log_file, "a") as f:
-                f.write(formatted_message + "\n")
+        with LOG_LOCK:
+            f = log_files.get(log_file)
+            if f is None:
+                f = log_files[log_file] = open(log_file, "a", buffering=1)
+            f.write(formatted_message + "\n")
 
 
-def extract_text_from_pdf(
-    pdf_path, strategy, output_dir, log=False, track_errors=False
-):
+def preprocess_page_image(page, dpi=OCR_DPI):
+    pixmap = page.get_pixmap(dpi=dpi, colorspace=pymupdf.csGRAY)
+    grayscale = np.frombuffer(pixmap.samples, dtype=np.uint8).reshape(
+        pixmap.height, pixmap.width
+    )
+    binary = cv2.adaptiveThreshold(
+        grayscale,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY,
+        31,
+        10,
+    )
+    return Image.fromarray(binary).convert("1")
+
+
+def ocr_pdf_pages(pages, languages=OCR_LANGUAGES, dpi=OCR_DPI):
+    texts = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for start in range(0, len(pages), OCR_BATCH_SIZE):
+            batch = pages[start : start + OCR_BATCH_SIZE]
+            image_paths = []
+            for page in batch:
+                image_path = os.path.join(tmp_dir, f"page_{page.number}.png")
+                preprocess_page_image(page, dpi).save(image_path)
+                image_paths.append(image_path)
+            image_list_path = os.path.join(tmp_dir, "images.txt")
+            with open(image_list_path, "w") as f:
+                f.write("\n".join(image_paths) + "\n")
+            output = pytesseract.image_to_string(
+                image_list_path, lang=languages, config=OCR_CONFIG
+            )
+            batch_texts = output.split("\f")
+            texts.extend(
+                batch_texts[i] if i < len(batch_texts) else ""
+                for i in range(len(batch))
+            )
+    return texts
+
+
+def language_sample(texts):
+    sample = ""
+    for text in texts:
+        if len(sample) >= LANGUAGE_DETECTION_CHARS:
+            break
+        sample += text
+    return sample[:LANGUAGE_DETECTION_CHARS]
+
+
+def detect_ocr_languages(text):
+    if not text.strip():
+        return OCR_LANGUAGES
     try:
-        loader = UnstructuredFileLoader(
-            pdf_path, languages=["fra", "nld"], strategy=strategy
+        detected = detect_langs(text[:LANGUAGE_DETECTION_CHARS])[0]
+    except LangDetectException:
+        return OCR_LANGUAGES
+    if (
+        detected.prob < LANGUAGE_DETECTION_MIN_PROBABILITY
+        or detected.lang not in LANGUAGE_CODES
+    ):
+        return OCR_LANGUAGES
+    return LANGUAGE_CODES[detected.lang]
+
+
+def remember_document_languages(pdf_path, languages):
+    if len(document_languages) >= LANGUAGE_CACHE_SIZE:
+        document_languages.pop(next(iter(document_languages)))
+    document_languages[pdf_path] = languages
+
+
+def init_page_worker(pdf_path, languages):
+    global page_worker_document, page_worker_languages
+    init_worker()
+    page_worker_document = pymupdf.open(pdf_path)
+    page_worker_languages = languages
+
+
+def ocr_page_numbers_in_worker(page_numbers):
+    return ocr_pdf_pages(
+        [page_worker_document[page_number] for page_number in page_numbers],
+        page_worker_languages,
+    )
+
+
+def iter_ocr_batch_texts(pdf_path, doc, batches, languages, page_workers):
+    if page_workers <= 1:
+        for batch in batches:
+            yield ocr_pdf_pages([doc[page_number] for page_number in batch], languages)
+        return
+
+    with multiprocessing.Pool(
+        min(page_workers, len(batches)),
+        initializer=init_page_worker,
+        initargs=(pdf_path, languages),
+    ) as pool:
+        yield from pool.imap(ocr_page_numbers_in_worker, batches)
+
+
+def iter_pymupdf_page_text(pdf_path, page_workers=1, force_ocr=False):
+    with pymupdf.open(pdf_path) as doc:
+        texts = ["" if force_ocr else page.get_text("text") for page in doc]
+        ocr_page_numbers = [
+            page_number for page_number, text in enumerate(texts) if not text.strip()
+        ]
+        ocr_texts = {}
+        languages = document_languages.get(pdf_path)
+        if ocr_page_numbers and languages is None:
+            sample = language_sample(texts)
+            if not sample.strip():
+                first_page_number = ocr_page_numbers.pop(0)
+                sample = ocr_pdf_pages([doc[first_page_number]])[0]
+                ocr_texts[first_page_number] = sample
+            languages = detect_ocr_languages(sample)
+            remember_document_languages(pdf_path, languages)
+        use_page_pool = (
+            page_workers > 1 and len(ocr_page_numbers) >= PAGE_POOL_MIN_PAGES
+        )
+        batch_size = (
+            min(OCR_BATCH_SIZE, math.ceil(len(ocr_page_numbers) / page_workers))
+            if use_page_pool
+            else OCR_BATCH_SIZE
+        )
+        batches = [
+            ocr_page_numbers[start : start + batch_size]
+            for start in range(0, len(ocr_page_numbers), batch_size)
+        ]
+        ocr_batches = zip(
+            batches,
+            iter_ocr_batch_texts(
+                pdf_path, doc, batches, languages, page_workers if use_page_pool else 1
+            ),
         )
-        document = loader.load()
-        text = "\n\n".join([doc.page_content for doc in document])
-        return text
+        for page_number, text in enumerate(texts):
+            if text.strip():
+                yield text
+                continue
+            if page_number not in ocr_texts:
+                batch, batch_texts = next(ocr_batches)
+                ocr_texts.update(zip(batch, batch_texts))
+            yield ocr_texts.pop(page_number)
+
+
+def iter_pypdf_page_text(pdf_path):
+    import pypdf
+
+    reader = pypdf.PdfReader(pdf_path)
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+def iter_unstructured_text(pdf_path, strategy):
+    from langchain_community.document_loaders import UnstructuredFileLoader
+
+    languages = document_languages.get(pdf_path)
+    if languages is None and pymupdf is not None:
+        with pymupdf.open(pdf_path) as doc:
+            languages = detect_ocr_languages(
+                language_sample(page.get_text("text") for page in doc)
+            )
+    elif languages is None:
+        languages = OCR_LANGUAGES
+    loader = UnstructuredFileLoader(
+        pdf_path, languages=languages.split("+"), strategy=strategy
+    )
+    for doc in loader.lazy_load():
+        yield doc.page_content
+
+
+def is_short_text_document(pdf_path):
+    try:
+        with pymupdf.open(pdf_path) as doc:
+            return doc.page_count <= SHORT_DOCUMENT_MAX_PAGES and any(
+                len(page.get_text("text")) > SHORT_DOCUMENT_MIN_CHARS for page in doc
+            )
+    except Exception:
+        return False
+
+
+def choose_pipeline(pdf_path, strategy):
+    if pymupdf is None:
+        return "pypdf" if strategy == "fast" else "unstructured"
+    if strategy == "fast":
+        return "pymupdf"
+    if is_short_text_document(pdf_path):
+        return "pymupdf_ocr"
+    return "unstructured"
+
+
+def iter_text_from_pdf(
+    pdf_path,
+    strategy,
+    pipeline,
+    output_dir,
+    log=False,
+    track_errors=False,
+    page_workers=1,
+):
+    try:
+        if pipeline == "pymupdf":
+            yield from iter_pymupdf_page_text(pdf_path, page_workers)
+        elif pipeline == "pymupdf_ocr":
+            yield from iter_pymupdf_page_text(pdf_path, page_workers, force_ocr=True)
+        elif pipeline == "pypdf":
+            yield from iter_pypdf_page_text(pdf_path)
+        else:
+            yield from iter_unstructured_text(pdf_path, strategy)
     except Exception as e:
         if track_errors:
             error_message = f"Error loading PDF {pdf_path}: {str(e)}"
@@ -46,7 +329,65 @@ def extract_text_from_pdf(
 
         skipped_files_path = os.path.join(output_dir, "skipped_files.txt")
         log_msg(f"{pdf_path}", skipped_files_path, print_console=False)
-        return ""
+        raise ExtractionError(pdf_path) from e
+
+
+def scan_sector_code_spans(buf, literal, digit_table, code_char_table, max_gap):
+    spans = []
+    n = len(buf)
+    m = len(literal)
+    i = 0
+    while i + m <= n:
+        matched = True
+        for k in range(m):
+            if buf[i + k] != literal[k]:
+                matched = False
+                break
+        if not matched:
+            i += 1
+            continue
+        gap_start = i + m
+        if gap_start < n and buf[gap_start] == 115:
+            gap_start += 1
+        gap_end = gap_start
+        while (
+            gap_end < n
+            and gap_end - gap_start < max_gap
+            and not digit_table[buf[gap_end]]
+        ):
+            gap_end += 1
+        start = gap_end
+        while start >= gap_start and (start == n or not code_char_table[buf[start]]):
+            start -= 1
+        if start < gap_start:
+            i += 1
+            continue
+        end = start
+        while end < n and code_char_table[buf[end]]:
+            end += 1
+        spans.append((i, end))
+        i = end
+    return spans
+
+
+if numba is not None:
+    scan_sector_code_spans = numba.njit(cache=True)(scan_sector_code_spans)
+
+
+def find_sector_code_matches(text):
+    if numba is None or len(text) < SCANNER_MIN_CHARS:
+        return SECTOR_CODE_PATTERN.findall(text)
+    try:
+        encoded = text.encode("latin-1")
+    except UnicodeEncodeError:
+        return SECTOR_CODE_PATTERN.findall(text)
+    if any(c.isdecimal() and not c.isascii() for c in text):
+        return SECTOR_CODE_PATTERN.findall(text)
+    buf = np.frombuffer(encoded.lower(), dtype=np.uint8)
+    spans = scan_sector_code_spans(
+        buf, SECTOR_CODE_LITERAL, DIGIT_TABLE, CODE_CHAR_TABLE, SECTOR_CODE_MAX_GAP
+    )
+    return [text[start:end] for start, end in spans]
 
 
 def extract_sector_codes(
@@ -56,37 +397,50 @@ def extract_sector_codes(
     log=False,
     track_errors=False,
     redo_empty=False,
+    page_workers=1,
 ):
     log_file_path = os.path.join(output_dir, "logs.txt") if log else None
-    log_msg(f"Processing [{initial_strategy}] {pdf_path}", log_file_path)
-    text = extract_text_from_pdf(
-        pdf_path, initial_strategy, output_dir, log, track_errors
-    )
-
-    pattern = r"(paritaire[s]?[^\d]*[\d\s.]+)"
-    matches = re.findall(pattern, text, re.IGNORECASE)
+    pipeline = choose_pipeline(pdf_path, initial_strategy)
+    log_msg(f"Processing [{initial_strategy}/{pipeline}] {pdf_path}", log_file_path)
+    try:
+        matches = [
+            match
+            for page_text in iter_text_from_pdf(
+                pdf_path,
+                initial_strategy,
+                pipeline,
+                output_dir,
+                log,
+                track_errors,
+                page_workers,
+            )
+            for match in find_sector_code_matches(page_text)
+        ]
+        extraction_failed = False
+    except ExtractionError:
+        matches = []
+        extraction_failed = True
     all_codes = [
-        re.sub(
-            r"[\s]+", ";", re.sub(r"[^\d.]+|\.{2,}", " ", match.strip()).strip()
-        ).split(";")
+        CODE_SEPARATOR_PATTERN.sub(";", match).strip(";").split(";")
         for match in matches
     ]
     all_codes = [item for sublist in all_codes for item in sublist]
 
-    filtered_codes = []
-    for code in all_codes:
-        number_part = code.split(".")[0]
-        if len(number_part) < 3 or not code.replace(".", "", 1).isdigit():
-            if initial_strategy == "fast":
-                log_msg(
-                    f"Detected short or invalid codes, switching to ocr_only strategy for better accuracy. Detected: {all_codes}",
-                    log_file_path,
-                )
-                return extract_sector_codes(
-                    pdf_path, "ocr_only", output_dir, log, track_errors, redo_empty
-                )
-        else:
-            filtered_codes.append(code)
+    filtered_codes = list(filter(VALID_CODE_PATTERN.fullmatch, all_codes))
+    if initial_strategy == "fast" and len(filtered_codes) < len(all_codes):
+        log_msg(
+            f"Detected short or invalid codes, switching to ocr_only strategy for better accuracy. Detected: {all_codes}",
+            log_file_path,
+        )
+        return extract_sector_codes(
+            pdf_path,
+            "ocr_only",
+            output_dir,
+            log,
+            track_errors,
+            redo_empty,
+            page_workers,
+        )
 
     if initial_strategy == "fast" and not filtered_codes:
         if redo_empty:
@@ -95,7 +449,13 @@ def extract_sector_codes(
                 log_file_path,
             )
             return extract_sector_codes(
-                pdf_path, "ocr_only", output_dir, log, track_errors, redo_empty
+                pdf_path,
+                "ocr_only",
+                output_dir,
+                log,
+                track_errors,
+                redo_empty,
+                page_workers,
             )
         else:
             log_msg(
@@ -111,17 +471,65 @@ def extract_sector_codes(
         "Number of Codes": len(filtered_codes),
         "Processing Time": processing_time,
         "Used OCR Only": used_ocr_only,
+        "Pipeline": pipeline,
+        "Extraction Failed": extraction_failed,
     }
 
 
+def hash_file(file_path):
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_cached_result(cache_path):
+    if not os.path.exists(cache_path):
+        return None
+    with open(cache_path) as f:
+        return json.load(f)
+
+
+def save_cached_result(cache_path, result):
+    ensure_dir(cache_path)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({column: result[column] for column in CACHED_COLUMNS}, f)
+    os.replace(tmp_path, cache_path)
+
+
 def process_single_pdf(
-    pdf_path, strategy, output_dir, log=False, track_errors=False, redo_empty=False
+    pdf_path,
+    strategy,
+    output_dir,
+    log=False,
+    track_errors=False,
+    redo_empty=False,
+    page_workers=1,
 ):
     try:
+        content_hash = hash_file(pdf_path)
+        cache_path = os.path.join(output_dir, "cache", f"{content_hash}.json")
+        cached = load_cached_result(cache_path)
+        if cached:
+            log_file_path = os.path.join(output_dir, "logs.txt") if log else None
+            log_msg(f"Using cached result for {pdf_path}", log_file_path)
+            return {
+                "Document Name": os.path.basename(pdf_path),
+                **cached,
+                "Processing Time": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "Content Hash": content_hash,
+            }
+
         result = extract_sector_codes(
-            pdf_path, strategy, output_dir, log, track_errors, redo_empty
+            pdf_path, strategy, output_dir, log, track_errors, redo_empty, page_workers
         )
         if result:
+            result["Content Hash"] = content_hash
+            extraction_failed = result.pop("Extraction Failed")
+            if result["Number of Codes"] and not extraction_failed:
+                save_cached_result(cache_path, result)
             return result
     except Exception as e:
         log_file_path = os.path.join(output_dir, "logs.txt")
@@ -133,6 +541,59 @@ def process_single_pdf(
     return None
 
 
+def iter_pdf_files(input_path):
+    if os.path.isdir(input_path):
+        with os.scandir(input_path) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(".pdf") and entry.is_file():
+                    yield entry.path
+    elif input_path.lower().endswith(".pdf"):
+        yield input_path
+
+
+def conform_results(table):
+    return pa.table(
+        [
+            table[field.name].cast(field.type)
+            if field.name in table.column_names
+            else pa.nulls(table.num_rows, field.type)
+            for field in RESULT_SCHEMA
+        ],
+        schema=RESULT_SCHEMA,
+    )
+
+
+def read_existing_results(output_parquet, output_csv, partial_parquet):
+    if os.path.exists(output_parquet):
+        table = pq.read_table(output_parquet)
+    elif os.path.exists(output_csv):
+        table = pa_csv.read_csv(
+            output_csv,
+            convert_options=pa_csv.ConvertOptions(column_types=RESULT_SCHEMA),
+        )
+    else:
+        table = RESULT_SCHEMA.empty_table()
+    tables = [conform_results(table)]
+    if os.path.exists(partial_parquet):
+        try:
+            tables.append(conform_results(pq.read_table(partial_parquet)))
+        except pa.ArrowInvalid:
+            pass
+    return pa.concat_tables(tables)
+
+
+def export_results(partial_parquet, output_parquet, output_csv):
+    df = pq.read_table(partial_parquet).to_pandas()
+    df = df.drop_duplicates("Document Name", keep="last")
+    pq.write_table(
+        pa.Table.from_pandas(df, schema=RESULT_SCHEMA, preserve_index=False),
+        output_parquet,
+        compression="zstd",
+    )
+    os.remove(partial_parquet)
+    df.to_csv(output_csv, index=False)
+
+
 def process_pdfs(
     input_path,
     output_dir,
@@ -140,41 +601,29 @@ def process_pdfs(
     log=False,
     track_errors=False,
     redo_empty=False,
+    page_workers=1,
 ):
     output_csv = os.path.join(output_dir, "output.csv")
+    output_parquet = os.path.join(output_dir, "output.parquet")
+    partial_parquet = f"{output_parquet}.partial"
     ensure_dir(output_csv)
     log_file = os.path.join(output_dir, "logs.txt") if log else None
     error_log_path = (
         os.path.join(output_dir, "error_logs.txt") if track_errors else None
     )
 
-    if os.path.exists(output_csv):
-        df = pd.read_csv(output_csv)
-    else:
-        df = pd.DataFrame(
-            columns=[
-                "Document Name",
-                "Sector Codes",
-                "Number of Codes",
-                "Processing Time",
-                "Used OCR Only",
-            ]
-        )
-
-    lock = threading.Lock()
-    with ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = []
-        if os.path.isdir(input_path):
-            files = [
-                os.path.join(input_path, f)
-                for f in os.listdir(input_path)
-                if f.lower().endswith(".pdf")
-            ]
-        else:
-            files = [input_path] if input_path.lower().endswith(".pdf") else []
+    existing_results = read_existing_results(
+        output_parquet, output_csv, partial_parquet
+    )
+    try:
+        with pq.ParquetWriter(
+            partial_parquet, RESULT_SCHEMA, compression="zstd"
+        ) as writer, ProcessPoolExecutor(
+            max_workers=num_threads, initializer=init_worker
+        ) as executor:
+            writer.write_table(existing_results)
 
-        for filename in files:
-            futures.append(
+            futures = [
                 executor.submit(
                     process_single_pdf,
                     filename,
@@ -183,17 +632,24 @@ def process_pdfs(
                     log,
                     track_errors,
                     redo_empty,
+                    page_workers,
                 )
-            )
-
-        for future in futures:
-            result = future.result()
-            if result:
-                with lock:
-                    df = df[df["Document Name"] != result["Document Name"]]
-                    df = pd.concat([df, pd.DataFrame([result])], ignore_index=True)
-                    df.to_csv(output_csv, index=False)
+                for filename in iter_pdf_files(input_path)
+            ]
 
+            for future in as_completed(futures):
+                try:
+                    result = future.result()
+                except BrokenProcessPool as e:
+                    log_msg(f"Worker process crashed: {e}", log_file)
+                    continue
+                if result:
+                    writer.write_batch(
+                        pa.RecordBatch.from_pylist([result], schema=RESULT_SCHEMA)
+                    )
+    finally:
+        if os.path.exists(partial_parquet):
+            export_results(partial_parquet, output_parquet, output_csv)
     log_msg(f"CSV file has been updated: {output_csv}", log_file)
 
 
@@ -220,7 +676,13 @@ def main():
         "--num-threads",
         type=int,
         default=1,
-        help="Number of threads or cores to use for parallel processing",
+        help="Number of worker processes to use for parallel processing",
+    )
+    parser.add_argument(
+        "--page-workers",
+        type=int,
+        default=1,
+        help="Number of processes used to extract and OCR the pages of a single PDF",
     )
     args = parser.parse_args()
 
@@ -243,6 +705,7 @@ def main():
         args.log,
         args.errors,
         args.redo_empty,
+        args.page_workers,
     )
 
 
@@ -0,0 +1,91 @@
+import os
+import random
+import re
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+ec = pytest.importorskip("extract_codes")
+
+FUZZ_ALPHABET = [
+    "paritaire",
+    "PARITAIRES",
+    "Paritaire:",
+    "s",
+    "S",
+    "a",
+    "é",
+    "°",
+    " ",
+    "\n",
+    "\t",
+    "\xa0",
+    "\x85",
+    "\x1c",
+    ".",
+    "..",
+    "1",
+    "23",
+    "456",
+    "x",
+]
+FUZZ_MAX_GAP = 12
+
+
+def scan_with_tables(text, max_gap):
+    buf = ec.np.frombuffer(text.encode("latin-1").lower(), dtype=ec.np.uint8)
+    spans = ec.scan_sector_code_spans(
+        buf, ec.SECTOR_CODE_LITERAL, ec.DIGIT_TABLE, ec.CODE_CHAR_TABLE, max_gap
+    )
+    return [text[start:end] for start, end in spans]
+
+
+def test_scanner_matches_regex_on_latin1_text():
+    pattern = re.compile(
+        ec.SECTOR_CODE_PATTERN.pattern.replace(
+            f"{{0,{ec.SECTOR_CODE_MAX_GAP}}}", f"{{0,{FUZZ_MAX_GAP}}}"
+        )
+    )
+    rng = random.Random(7)
+    for _ in range(20000):
+        text = "".join(rng.choice(FUZZ_ALPHABET) for _ in range(rng.randint(0, 30)))
+        assert scan_with_tables(text, FUZZ_MAX_GAP) == pattern.findall(text), repr(text)
+
+
+def test_scanner_matches_regex_with_default_gap():
+    text = "Commission paritaire n° 200\xa0201\x85 et " + "x" * 250 + " paritaire 118"
+    assert scan_with_tables(text, ec.SECTOR_CODE_MAX_GAP) == (
+        ec.SECTOR_CODE_PATTERN.findall(text)
+    )
+
+
+def test_non_breaking_space_separates_codes():
+    (match,) = ec.SECTOR_CODE_PATTERN.findall("Commission paritaire n° 200\xa0201")
+    codes = ec.CODE_SEPARATOR_PATTERN.sub(";", match).strip(";").split(";")
+    assert list(filter(ec.VALID_CODE_PATTERN.fullmatch, codes)) == ["200", "201"]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Commission paritaire n° ٢٠٠ et 201",
+        "Commission paritaire n° 200 – 201",
+        "Commission pariſtaire 200 ſ paritaireſ 201",
+    ],
+)
+def test_find_matches_falls_back_to_regex(monkeypatch, text):
+    def fail_scan(*args):
+        raise AssertionError("scanner used")
+
+    monkeypatch.setattr(ec, "numba", object())
+    monkeypatch.setattr(ec, "SCANNER_MIN_CHARS", 0)
+    monkeypatch.setattr(ec, "scan_sector_code_spans", fail_scan)
+    assert ec.find_sector_code_matches(text) == ec.SECTOR_CODE_PATTERN.findall(text)
+
+
+def test_find_matches_uses_scanner_for_latin1_text(monkeypatch):
+    text = "Commission paritaire n° 200\xa0201 et PARITAIRES 118.01"
+    monkeypatch.setattr(ec, "numba", object())
+    monkeypatch.setattr(ec, "SCANNER_MIN_CHARS", 0)
+    assert ec.find_sector_code_matches(text) == ec.SECTOR_CODE_PATTERN.findall(text)